@@ -11,25 +11,35 @@ from bluepy import btle
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_MTU = 23
+_PREFERRED_MTU = 247
+_MAX_REASSEMBLY_LEN = 1024
+
 
 class ConnectionManager:
     """Manage BLE peripheral connections.
 
     Attributes:
         peri (btle.Peripheral | None): The connected BLE peripheral or None if not connected.
+        mtu (int): Negotiated ATT_MTU of the current connection.
     """
 
     def __init__(self) -> None:
         """Initialize a ConnectionManager with no active connection.
 
-        Sets peri to None and initializes MAC address storage.
+        Sets peri to None and initializes MAC address and MTU storage.
         """
         self.peri: btle.Peripheral | None = None
+        self.mtu: int = _DEFAULT_MTU
         self._mac_address: str = ""
 
     def connect(self, mac_address: str) -> None:
         """Establish a BLE connection to the specified peripheral device.
 
+        After connecting, a larger ATT_MTU is requested so that each GATT
+        write can carry more payload. If negotiation fails, the legacy
+        23-byte MTU is kept.
+
         Args:
             mac_address (str): MAC address of the BLE device to connect to.
 
@@ -44,6 +54,14 @@ class ConnectionManager:
             raise ConnectionError(
                 f"Failed to connect. mac_address: {self._mac_address}"
             ) from e
+        try:
+            # The server may grant less than requested; setMTU returns the
+            # negotiated value in the response.
+            resp = self.peri.setMTU(_PREFERRED_MTU)
+            self.mtu = resp["mtu"][0]
+        except (btle.BTLEException, KeyError, IndexError) as e:
+            self.mtu = _DEFAULT_MTU
+            logger.debug("MTU negotiation failed, keeping %s. Error: %s", self.mtu, e)
 
     def disconnect(self) -> None:
         """Terminate the BLE connection.
@@ -76,6 +94,7 @@ class GattManager(btle.DefaultDelegate):
         handle_write: int,
         handle_notify: int,
         callback: Callable[[bytes, bool], None],
+        mtu: int = _DEFAULT_MTU,
     ) -> None:
         """Initialize the GattManager.
 
@@ -91,13 +110,18 @@ class GattManager(btle.DefaultDelegate):
             handle_notify (int): The handle for the notify characteristic.
             callback (Callable[[bytes, bool], None]): Callback invoked with
                 complete payloads and encryption status.
+            mtu (int, optional): Negotiated ATT_MTU; each fragment carries
+                mtu - 4 bytes of payload (3-byte ATT header plus the 1-byte
+                fragment header). Defaults to the legacy 23-byte MTU.
         """
         super().__init__()
         self._peri: btle.Peripheral = peri
         self._callback: Callable[[bytes, bool], None] = callback
         self._handle_write: int = handle_write
         self._handle_notify: int = handle_notify
-        self._buffer: bytes = b""
+        self._max_payload: int = mtu - 4
+        self._buffer: bytearray = bytearray()
+        self._discard_fragments: bool = False
         self._peri.withDelegate(self)
 
     def enable_notification(self) -> None:
@@ -128,46 +152,71 @@ class GattManager(btle.DefaultDelegate):
         is_beginning = bool(data[0] & 0b1)
         is_end = bool(data[0] & 0b110)
         is_encrypted = bool(data[0] & 0b100)
+        callback = self._callback
+        if is_beginning and is_end:
+            callback(bytes(data[1:]), is_encrypted)
+            return
+        buffer = self._buffer
         if is_beginning:
-            self._buffer = b""
-        self._buffer += data[1:]
+            self._discard_fragments = False
+            del buffer[:]
+        elif self._discard_fragments:
+            # Remainder of a message whose earlier fragments overflowed the
+            # buffer; delivering it would hand the callback a corrupt tail.
+            return
+        buffer.extend(memoryview(data)[1:])
         if not is_end:
+            if len(buffer) > _MAX_REASSEMBLY_LEN:
+                logger.debug("Reassembly buffer overflowed, discarding fragments.")
+                del buffer[:]
+                self._discard_fragments = True
             return
-        self._callback(self._buffer, is_encrypted)
+        callback(bytes(buffer), is_encrypted)
+        del buffer[:]
 
-    def write(self, data: bytes, is_encrypted: bool) -> None:
+    def write(self, data: bytes, is_encrypted: bool, reliable: bool = False) -> None:
         """Send data to the BLE write characteristic in segmented packets.
 
-        Data is split into 20-byte segments. Each segment includes a header byte
-        indicating its position in the sequence and whether the data is encrypted.
+        Data is split into MTU-sized payload segments. Each segment is prefixed
+        with a header byte indicating its position in the sequence and whether
+        the data is encrypted. Intermediate segments are sent without response
+        so multiple PDUs can be queued per connection interval; only the final
+        segment waits for an acknowledgement, which also serves as flow control.
 
         Args:
             data (bytes): Payload to write.
             is_encrypted (bool): Whether the data is encrypted.
+            reliable (bool, optional): If True, every segment waits for a
+                response instead of only the final one. Defaults to False.
 
         Raises:
             ConnectionError: If a write operation fails.
         """
-        remains = len(data)
+        length = len(data)
+        max_payload = self._max_payload
+        write_characteristic = self._peri.writeCharacteristic
+        handle_write = self._handle_write
+        if length <= max_payload:
+            header = 1 + (1 << (1 + is_encrypted))
+            try:
+                write_characteristic(handle_write, bytes((header,)) + data, True)
+            except btle.BTLEException as e:
+                raise ConnectionError("Failed to write GATT.") from e
+            return
+        view = memoryview(data)
+        end_shift = 1 + is_encrypted
         offset = 0
-        while remains:
-            is_beginning = not bool(offset)
-            if remains <= 19:
-                buffer = data[offset:]
-                remains = 0
-                is_end = True
-            else:
-                buffer = data[offset : offset + 20]
-                offset += 19
-                remains -= 19
-                is_end = False
-            header = is_beginning + (is_end << (1 + is_encrypted))
+        while offset < length:
+            end = min(offset + max_payload, length)
+            is_beginning = offset == 0
+            is_end = end == length
+            header = is_beginning + (is_end << end_shift)
+            packet = b"".join((bytes((header,)), view[offset:end]))
             try:
-                self._peri.writeCharacteristic(
-                    self._handle_write, bytes([header]) + buffer, True
-                )
+                write_characteristic(handle_write, packet, reliable or is_end)
             except btle.BTLEException as e:
                 raise ConnectionError("Failed to write GATT.") from e
+            offset = end
 
 
 class NotificationThreadManager:
@@ -201,9 +250,18 @@ class NotificationThreadManager:
         """
 
         def notification_loop() -> None:
+            wait_for_notifications = self._peri.waitForNotifications
+            # waitForNotifications blocks inside bluepy-helper and cannot be
+            # interrupted, so the timeout bounds how long stop() may wait.
             while not self._stop_thread:
                 try:
-                    if self._peri.waitForNotifications(1.0):
+                    if wait_for_notifications(0.05):
+                        # Fragments of one message often share a connection
+                        # interval; drain them with a minimal timeout. bluepy
+                        # treats a zero timeout as "no timeout" and would
+                        # block forever.
+                        while wait_for_notifications(0.001):
+                            pass
                         continue
                 except btle.BTLEException as e:
                     logger.error("Error in notification loop. Error: %s", e)
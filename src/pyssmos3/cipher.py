@@ -4,8 +4,29 @@ This module defines a function to generate a CMAC-based token and
 a CipherManager class for AES-CCM encryption/decryption with a rolling counter.
 """
 
-from Crypto.Cipher import AES
-from Crypto.Hash import CMAC
+import struct
+from functools import lru_cache
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers import algorithms
+from cryptography.hazmat.primitives.ciphers.aead import AESCCM
+from cryptography.hazmat.primitives.cmac import CMAC
+
+
+@lru_cache(maxsize=8)
+def _aes_algorithm(secret_key: bytes) -> algorithms.AES:
+    """Returns a cached AES algorithm object for the given secret key.
+
+    Recovery loops re-derive the token with the same secret key on every
+    reconnect, so the validated AES primitive is cached instead of being
+    rebuilt each time.
+
+    Args:
+        secret_key (bytes): The AES key used for CMAC generation.
+
+    Returns:
+        algorithms.AES: The AES algorithm primitive for the key.
+    """
+    return algorithms.AES(secret_key)
 
 
 def generate_token(secret_key: bytes, random_code: bytes) -> bytes:
@@ -21,9 +42,9 @@ def generate_token(secret_key: bytes, random_code: bytes) -> bytes:
     Returns:
         bytes: The generated CMAC digest as a token.
     """
-    cobj = CMAC.new(secret_key, ciphermod=AES)
+    cobj = CMAC(_aes_algorithm(secret_key))
     cobj.update(random_code)
-    token = cobj.digest()
+    token = cobj.finalize()
     return token
 
 
@@ -43,8 +64,13 @@ class CipherManager:
             random_code (bytes): A random sequence used in nonce construction.
             token (bytes): A CMAC-derived token used as the AES key for CCM mode.
         """
-        self._random_code: bytes = random_code
-        self._token: bytes = token
+        self._aesccm: AESCCM = AESCCM(token, tag_length=4)
+        self._aad: bytes = b"\x00"
+        nonce_suffix = b"\x00" + random_code
+        self._encrypt_nonce: bytearray = bytearray(13)
+        self._encrypt_nonce[8:] = nonce_suffix
+        self._decrypt_nonce: bytearray = bytearray(13)
+        self._decrypt_nonce[8:] = nonce_suffix
         self._encrypt_counter: int = 0
         self._decrypt_counter: int = 0
 
@@ -63,14 +89,10 @@ class CipherManager:
         Raises:
             ValueError: If the provided key or nonce length is invalid.
         """
-        nonce = (
-            self._encrypt_counter.to_bytes(8, "little") + b"\x00" + self._random_code
-        )
-        cipher = AES.new(self._token, AES.MODE_CCM, nonce=nonce, mac_len=4)
-        cipher.update(b"\x00")
-        ciphertext, tag = cipher.encrypt_and_digest(data)
+        struct.pack_into("<Q", self._encrypt_nonce, 0, self._encrypt_counter)
+        ciphertext = self._aesccm.encrypt(self._encrypt_nonce, data, self._aad)
         self._encrypt_counter += 1
-        return ciphertext + tag
+        return ciphertext
 
     def decrypt(self, data: bytes) -> bytes:
         """Decrypt data encrypted by this manager, verifying authenticity.
@@ -87,11 +109,10 @@ class CipherManager:
         Raises:
             ValueError: If authentication tag verification fails or data is malformed.
         """
-        nonce = (
-            self._decrypt_counter.to_bytes(8, "little") + b"\x00" + self._random_code
-        )
-        cipher = AES.new(self._token, AES.MODE_CCM, nonce=nonce, mac_len=4)
-        cipher.update(b"\x00")
-        plaintext = cipher.decrypt_and_verify(data[:-4], data[-4:])
+        struct.pack_into("<Q", self._decrypt_nonce, 0, self._decrypt_counter)
+        try:
+            plaintext = self._aesccm.decrypt(self._decrypt_nonce, data, self._aad)
+        except InvalidTag as e:
+            raise ValueError("Authentication tag verification failed.") from e
         self._decrypt_counter += 1
         return plaintext
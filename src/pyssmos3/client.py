@@ -6,16 +6,30 @@ lock/unlock commands, and automatic recovery from errors.
 
 from dataclasses import dataclass
 import logging
-import time
+import threading
 from typing import Callable
 from .ble import ConnectionManager, GattManager, NotificationThreadManager
 from .cipher import CipherManager, generate_token
-from .const import BleHandle, DeviceStatus, SsmItemCode
+from .const import (
+    BleHandle,
+    DeviceStatus,
+    I_SSM_ITEM_CODE_LOCK,
+    I_SSM_ITEM_CODE_LOGIN,
+    I_SSM_ITEM_CODE_UNLOCK,
+)
 from .protocol import ReceivedDataHandler
 from .recovery import RecoveryManager
 
 logger = logging.getLogger(__name__)
 
+_STATUS_DISCONNECTED = int(DeviceStatus.SSM_DISCONNECTED)
+_STATUS_CONNECTED = int(DeviceStatus.SSM_CONNECTED)
+_STATUS_LOGGIN = int(DeviceStatus.SSM_LOGGIN)
+
+_LOGIN_CODE = bytes((I_SSM_ITEM_CODE_LOGIN,))
+_LOCK_CODE = bytes((I_SSM_ITEM_CODE_LOCK,))
+_UNLOCK_CODE = bytes((I_SSM_ITEM_CODE_UNLOCK,))
+
 
 @dataclass
 class SsmDevice:
@@ -72,6 +86,7 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
         self._gatt_manager: GattManager | None = None
         self._ble_thread_manager: NotificationThreadManager | None = None
         self._cipher_manager: CipherManager | None = None
+        self._login_done: threading.Event = threading.Event()
 
     def connect(
         self, mac_address: str, secret_key: str, max_retries: int = 3, interval: int = 5
@@ -88,7 +103,7 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
             max_retries (int, optional): Maximum number of retry attempts. Defaults to 3.
             interval (int, optional): Interval between retries in seconds. Defaults to 5.
         """
-        if self.ssm_device.device_status != DeviceStatus.SSM_DISCONNECTED:
+        if self.ssm_device.device_status != _STATUS_DISCONNECTED:
             logger.warning("Already connected to SSM device.")
             return
 
@@ -97,11 +112,9 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
 
         self._recovery_manager.start_monitoring(self.reconnect, max_retries, interval)
 
+        self._login_done.clear()
         self._run()
-        while self.ssm_device.device_status <= DeviceStatus.SSM_LOGGIN:
-            if self._recovery_manager.is_recovery_failed:
-                break
-            time.sleep(0.1)
+        self._login_done.wait()
 
     def stop(self) -> None:
         """Stops the SSM client and disconnects from the device.
@@ -119,11 +132,11 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
         Args:
             history_name (str): Name to record in the operation history.
         """
-        if self.ssm_device.device_status <= DeviceStatus.SSM_LOGGIN:
+        if self.ssm_device.device_status <= _STATUS_LOGGIN:
             logger.warning("Not logged in to SSM device.")
             return
         tag = history_name.encode()
-        command = bytes([SsmItemCode.SSM_ITEM_CODE_LOCK, len(tag)]) + tag
+        command = _LOCK_CODE + bytes((len(tag),)) + tag
         self._send(command, True)
 
     def unlock(self, history_name: str) -> None:
@@ -132,11 +145,11 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
         Args:
             history_name (str): Name to record in the operation history.
         """
-        if self.ssm_device.device_status <= DeviceStatus.SSM_LOGGIN:
+        if self.ssm_device.device_status <= _STATUS_LOGGIN:
             logger.warning("Not logged in to SSM device.")
             return
         tag = history_name.encode()
-        command = bytes([SsmItemCode.SSM_ITEM_CODE_UNLOCK, len(tag)]) + tag
+        command = _UNLOCK_CODE + bytes((len(tag),)) + tag
         self._send(command, True)
 
     def on_mechstatus_changed(
@@ -160,6 +173,7 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
         """Callback triggered when all recovery attempts have failed."""
         self.ssm_device.device_status = DeviceStatus.SSM_DISCONNECTED
         self._callback_on_connect(False)
+        self._login_done.set()
 
     def reconnect(self) -> None:
         """Reconnects to the SSM device after a failure.
@@ -190,6 +204,7 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
             BleHandle.BLE_HANDLE_WRITE,
             BleHandle.BLE_HANDLE_NOTIFICATION,
             self._received_data_handler.process_data,
+            self._connection_manager.mtu,
         )
         self._ble_thread_manager = NotificationThreadManager(
             self._connection_manager.peri, self._recovery_manager.perform_recovery
@@ -227,19 +242,20 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
             self._recovery_manager.perform_recovery()
             return
         self._recovery_manager.reset_fail_count()
-        if self.ssm_device.device_status == DeviceStatus.SSM_LOGGIN:
+        if self.ssm_device.device_status == _STATUS_LOGGIN:
             self.ssm_device.device_status = DeviceStatus.SSM_UNLOCKED
         logger.debug(
             "Login successful. timestamp: %s",
             self._received_data_handler.login_timestamp,
         )
         self._callback_on_connect(True)
+        self._login_done.set()
 
     def _disconnect_and_cleanup(self) -> None:
         """Stops notification thread and disconnects from the SSM device."""
         if self._ble_thread_manager and self._ble_thread_manager.is_running():
             self._ble_thread_manager.stop_wait_for_notification()
-        if self.ssm_device.device_status >= DeviceStatus.SSM_CONNECTED:
+        if self.ssm_device.device_status >= _STATUS_CONNECTED:
             self._connection_manager.disconnect()
             logger.debug("BLE disconnected.")
         self.ssm_device.device_status = DeviceStatus.SSM_DISCONNECTED
@@ -282,13 +298,9 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
 
         self._gatt_manager.enable_notification()
         self._ble_thread_manager.start_wait_for_notification()
-        counter = 0
-        while not self._received_data_handler.random_code:
-            if counter >= 50:
-                logger.error("Failed to receive random code from SSM device.")
-                raise ConnectionError("SSM device not responding.")
-            time.sleep(0.1)
-            counter += 1
+        if not self._received_data_handler.random_code_event.wait(5.0):
+            logger.error("Failed to receive random code from SSM device.")
+            raise ConnectionError("SSM device not responding.")
 
     def _login(self) -> None:
         """Sends login command and waits for login timestamp.
@@ -296,12 +308,8 @@ class SsmClient:  # Central client class, so pylint: disable=too-many-instance-a
         Raises:
             ConnectionError: If login timestamp is not received in time.
         """
-        command = bytes([SsmItemCode.SSM_ITEM_CODE_LOGIN]) + self.ssm_device.token[:4]
+        command = _LOGIN_CODE + self.ssm_device.token[:4]
         self._send(command, False)
-        counter = 0
-        while not self._received_data_handler.login_timestamp:
-            if counter >= 50:
-                logger.error("Failed to receive login timestamp from SSM device.")
-                raise ConnectionError("SSM device not responding.")
-            time.sleep(0.1)
-            counter += 1
+        if not self._received_data_handler.login_event.wait(5.0):
+            logger.error("Failed to receive login timestamp from SSM device.")
+            raise ConnectionError("SSM device not responding.")
@@ -96,3 +96,14 @@ class SsmOpCode(IntEnum):
 
     SSM_OP_CODE_RESPONSE = 0x07
     SSM_OP_CODE_PUBLISH = 0x08
+
+
+# Plain-int aliases of the codes referenced on hot paths, so packet dispatch
+# skips the IntEnum descriptor lookup. The enums above remain the public API.
+I_SSM_OP_CODE_RESPONSE = int(SsmOpCode.SSM_OP_CODE_RESPONSE)
+I_SSM_OP_CODE_PUBLISH = int(SsmOpCode.SSM_OP_CODE_PUBLISH)
+I_SSM_ITEM_CODE_LOGIN = int(SsmItemCode.SSM_ITEM_CODE_LOGIN)
+I_SSM_ITEM_CODE_INITIAL = int(SsmItemCode.SSM_ITEM_CODE_INITIAL)
+I_SSM_ITEM_CODE_MECH_STATUS = int(SsmItemCode.SSM_ITEM_CODE_MECH_STATUS)
+I_SSM_ITEM_CODE_LOCK = int(SsmItemCode.SSM_ITEM_CODE_LOCK)
+I_SSM_ITEM_CODE_UNLOCK = int(SsmItemCode.SSM_ITEM_CODE_UNLOCK)
@@ -5,14 +5,102 @@ parses operation and item codes, extracts random codes and login timestamps,
 and processes mechanical status updates to be passed to a callback.
 """
 
+import bisect
 import logging
+import struct
+import threading
 import time
 from typing import Any, Callable
 from .cipher import CipherManager
-from .const import SsmItemCode, SsmOpCode
+from .const import (
+    I_SSM_ITEM_CODE_INITIAL,
+    I_SSM_ITEM_CODE_LOGIN,
+    I_SSM_ITEM_CODE_MECH_STATUS,
+    I_SSM_OP_CODE_PUBLISH,
+    I_SSM_OP_CODE_RESPONSE,
+)
 
 logger = logging.getLogger(__name__)
 
+_MECH_STATUS = struct.Struct("<HhhB")
+
+_POS_SCALE = 1024 / 360
+
+_MASK_CLUTCH_FAILED = 0b0000001
+_MASK_LOCK_RANGE = 0b0000010
+_MASK_UNLOCK_RANGE = 0b0000100
+_MASK_CRITICAL = 0b0001000
+_MASK_STOP = 0b0010000
+_MASK_LOW_BATTERY = 0b0100000
+_MASK_CLOCKWISE = 0b1000000
+
+_VOLTAGE_LEVELS = (
+    4.6,
+    4.8,
+    5.0,
+    5.10,
+    5.20,
+    5.40,
+    5.50,
+    5.55,
+    5.60,
+    5.65,
+    5.70,
+    5.73,
+    5.76,
+    5.79,
+    5.82,
+    5.85,
+)
+_BATTERY_PERCENTAGES = (
+    0.0,
+    3.0,
+    7.0,
+    10.0,
+    13.0,
+    21.0,
+    32.0,
+    40.0,
+    50.0,
+    60.0,
+    70.0,
+    80.0,
+    85.0,
+    90.0,
+    95.0,
+    100.0,
+)
+
+
+def _calculate_battery_percentage(voltage: float) -> int:
+    """Convert voltage reading to estimated battery percentage.
+
+    Args:
+        voltage (float): Battery voltage in volts.
+
+    Returns:
+        int: Battery percentage between 0 and 100.
+    """
+    if voltage >= _VOLTAGE_LEVELS[-1]:
+        return int(_BATTERY_PERCENTAGES[-1])
+    if voltage <= _VOLTAGE_LEVELS[0]:
+        return int(_BATTERY_PERCENTAGES[0])
+    index = bisect.bisect_right(_VOLTAGE_LEVELS, voltage)
+    lower_voltage = _VOLTAGE_LEVELS[index - 1]
+    upper_voltage = _VOLTAGE_LEVELS[index]
+    voltage_ratio = (voltage - lower_voltage) / (upper_voltage - lower_voltage)
+    lower_percent = _BATTERY_PERCENTAGES[index - 1]
+    upper_percent = _BATTERY_PERCENTAGES[index]
+    return int((upper_percent - lower_percent) * voltage_ratio + lower_percent)
+
+
+# Percentage fully precomputed for every possible raw uint16 battery reading
+# (raw / 500 volts, bit-identical to raw * 2 / 1000), so the hot path is a
+# single tuple index.
+_BATTERY_PERCENTAGE_LUT = tuple(
+    _calculate_battery_percentage(raw / 500) for raw in range(65536)
+)
+
 
 class ReceivedDataHandler:
     """
@@ -24,8 +112,25 @@ class ReceivedDataHandler:
     Attributes:
         random_code (bytes): Random code received during initialization publish.
         login_timestamp (int): UNIX timestamp received in the login response.
+        random_code_event (threading.Event): Set when the random code arrives.
+        login_event (threading.Event): Set when the login timestamp arrives.
     """
 
+    __slots__ = (
+        "random_code",
+        "login_timestamp",
+        "random_code_event",
+        "login_event",
+        "_callback",
+        "_recovery_handler",
+        "_cipher",
+        "_op_dispatch",
+        "_debug_enabled",
+        "_response_dispatch",
+        "_publish_dispatch",
+        "_last_mech_payload",
+    )
+
     def __init__(
         self,
         callback: Callable[[dict[str, Any], dict[str, Any]], None],
@@ -42,17 +147,37 @@ class ReceivedDataHandler:
         """
         self.random_code: bytes = b""
         self.login_timestamp: int = 0
+        self.random_code_event: threading.Event = threading.Event()
+        self.login_event: threading.Event = threading.Event()
         self._callback: Callable[[dict[str, Any], dict[str, Any]], None] = callback
         self._recovery_handler: Callable[[], None] = recovery_handler
         self._cipher: CipherManager | None = None
+        self._debug_enabled: Callable[[int], bool] = logger.isEnabledFor
+        self._last_mech_payload: bytes | None = None
+        self._op_dispatch: dict[int, Callable[[int, memoryview], None]] = {
+            I_SSM_OP_CODE_RESPONSE: self._handle_response,
+            I_SSM_OP_CODE_PUBLISH: self._handle_publish,
+        }
+        self._response_dispatch: dict[int, Callable[[memoryview], None]] = {
+            I_SSM_ITEM_CODE_LOGIN: self._handle_login_response,
+        }
+        self._publish_dispatch: dict[int, Callable[[memoryview], None]] = {
+            I_SSM_ITEM_CODE_INITIAL: self._handle_initial_publish,
+            I_SSM_ITEM_CODE_MECH_STATUS: self._handle_mech_status_publish,
+        }
 
     def enable_decryption(self, cipher: CipherManager) -> None:
         """Enable decryption of future BLE data.
 
+        Called once per (re)connection, so the mech status duplicate check
+        is also reset here; the first publish of a new session must always
+        reach the callback even if it matches the last pre-disconnect one.
+
         Args:
             cipher (CipherManager): Cipher instance to use for decryption.
         """
         self._cipher = cipher
+        self._last_mech_payload = None
 
     def process_data(self, data: bytes, is_encrypted: bool) -> None:
         """Process BLE data, decrypt if necessary, and dispatch based on op code.
@@ -73,110 +198,126 @@ class ReceivedDataHandler:
                 self._recovery_handler()
                 return
         op_code = data[0]
-        item_code = data[1]
-        match op_code:
-            case SsmOpCode.SSM_OP_CODE_RESPONSE:
-                payload = data[3:]
-                self._handle_response(item_code, payload)
-            case SsmOpCode.SSM_OP_CODE_PUBLISH:
-                payload = data[2:]
-                self._handle_publish(item_code, payload)
-            case _:
+        handler = self._op_dispatch.get(op_code)
+        if handler is None:
+            if self._debug_enabled(logging.DEBUG):
                 logger.debug("Unknown op code. op_code: %s", op_code)
+            return
+        handler(data[1], memoryview(data))
 
-    def _handle_response(self, item_code: int, payload: bytes) -> None:
+    def _handle_response(self, item_code: int, data: memoryview) -> None:
         """Handle response-type BLE messages.
 
         Args:
             item_code (int): Indicates which type of response this is.
-            payload (bytes): The response payload excluding the header.
+            data (memoryview): View of the complete message including the header.
         """
-        match item_code:
-            case SsmItemCode.SSM_ITEM_CODE_LOGIN:
-                self._handle_login_response(payload)
-            case _:
+        handler = self._response_dispatch.get(item_code)
+        if handler is None:
+            if self._debug_enabled(logging.DEBUG):
                 logger.debug("Unknown response. item_code: %s", item_code)
+            return
+        handler(data[3:])
 
-    def _handle_publish(self, item_code: int, payload: bytes) -> None:
+    def _handle_publish(self, item_code: int, data: memoryview) -> None:
         """Handle publish-type BLE messages.
 
         Args:
             item_code (int): Indicates which type of publish this is.
-            payload (bytes): The publish payload excluding the header.
+            data (memoryview): View of the complete message including the header.
         """
-        match item_code:
-            case SsmItemCode.SSM_ITEM_CODE_INITIAL:
-                self._handle_initial_publish(payload)
-            case SsmItemCode.SSM_ITEM_CODE_MECH_STATUS:
-                self._handle_mech_status_publish(payload)
-            case _:
+        handler = self._publish_dispatch.get(item_code)
+        if handler is None:
+            if self._debug_enabled(logging.DEBUG):
                 logger.debug("Unknown publish. item_code: %s", item_code)
+            return
+        handler(data[2:])
 
-    def _handle_login_response(self, payload: bytes) -> None:
+    def _handle_login_response(self, payload: memoryview) -> None:
         """Store login timestamp from the login response payload.
 
         Args:
-            payload (bytes): 4-byte little-endian timestamp.
+            payload (memoryview): 4-byte little-endian timestamp.
         """
         timestamp = int.from_bytes(payload, "little")
         self.login_timestamp = timestamp
+        self.login_event.set()
 
-    def _handle_initial_publish(self, payload: bytes) -> None:
+    def _handle_initial_publish(self, payload: memoryview) -> None:
         """Store the random code from the initialize message.
 
         Args:
-            payload (bytes): Random code as a byte sequence.
+            payload (memoryview): Random code as a byte sequence.
         """
-        self.random_code = payload
+        self.random_code = bytes(payload)
+        self.random_code_event.set()
 
-    def _handle_mech_status_publish(self, payload: bytes) -> None:
+    def _handle_mech_status_publish(self, payload: memoryview) -> None:
         """Parse mechanical status and call the callback with parsed results.
 
+        The device re-publishes its status frequently while idle; payloads
+        identical to the previous one are skipped without parsing or
+        invoking the callback.
+
         Args:
-            payload (bytes): Contains voltage, position, and status flags.
+            payload (memoryview): Contains voltage, position, and status flags.
         """
-        battery_voltage = int.from_bytes(payload[0:2], "little")
-        target = int.from_bytes(payload[2:4], "little", signed=True)
-        position = int.from_bytes(payload[4:6], "little", signed=True)
-        status_flags = payload[6]
-        status_flags_tuple = tuple(bool(status_flags & (1 << i)) for i in range(7))
+        if len(payload) < _MECH_STATUS.size:
+            logger.debug("Mech status payload too short. length: %s", len(payload))
+            return
+        if payload == self._last_mech_payload:
+            return
+        self._last_mech_payload = bytes(payload)
+        battery_voltage, target, position, status_flags = _MECH_STATUS.unpack_from(
+            payload
+        )
+        # not not yields the same bool as bool(...) without the call overhead.
+        is_lock_range = not not status_flags & _MASK_LOCK_RANGE
+        is_unlock_range = not not status_flags & _MASK_UNLOCK_RANGE
         raw_mech_status = {
             "battery": battery_voltage,
             "target": target,
             "position": position,
-            "is_clutch_failed": status_flags_tuple[0],
-            "is_lock_range": status_flags_tuple[1],
-            "is_unlock_range": status_flags_tuple[2],
-            "is_critical": status_flags_tuple[3],
-            "is_stop": status_flags_tuple[4],
-            "is_low_battery": status_flags_tuple[5],
-            "is_clockwise": status_flags_tuple[6],
+            "is_clutch_failed": not not status_flags & _MASK_CLUTCH_FAILED,
+            "is_lock_range": is_lock_range,
+            "is_unlock_range": is_unlock_range,
+            "is_critical": not not status_flags & _MASK_CRITICAL,
+            "is_stop": not not status_flags & _MASK_STOP,
+            "is_low_battery": not not status_flags & _MASK_LOW_BATTERY,
+            "is_clockwise": not not status_flags & _MASK_CLOCKWISE,
         }
-        mech_status_webapi_format = self._convert_to_webapi_format(raw_mech_status)
+        mech_status_webapi_format = self._convert_to_webapi_format(
+            battery_voltage, position, is_lock_range, is_unlock_range
+        )
         self._callback(mech_status_webapi_format, raw_mech_status)
 
     def _convert_to_webapi_format(
-        self, raw_mech_status: dict[str, Any]
+        self, battery: int, position: int, is_lock_range: bool, is_unlock_range: bool
     ) -> dict[str, Any]:
-        """Convert raw mechanical status to a format compatible with a Web API.
+        """Convert raw mechanical status fields to a format compatible with a Web API.
 
         Args:
-            raw_mech_status (dict[str, Any]): Raw mechanical data parsed from BLE payload.
+            battery (int): Raw battery reading from the BLE payload.
+            position (int): Raw angle reading from the BLE payload.
+            is_lock_range (bool): Whether the mechanism is in the locked range.
+            is_unlock_range (bool): Whether the mechanism is in the unlocked range.
 
         Returns:
             dict[str, Any]: Formatted status containing battery level, position, lock state,
                 and timestamp.
         """
-        battery_voltage = raw_mech_status["battery"] * 2 / 1000
-        battery_percentage = self._calculate_battery_percentage(battery_voltage)
-        position = int(raw_mech_status["position"] * 1024 / 360)
-        if raw_mech_status["is_lock_range"]:
+        # x / 500 is bit-identical to the original x * 2 / 1000 in IEEE 754;
+        # multiplying by a folded 2 / 1000 constant is not.
+        battery_voltage = battery / 500
+        battery_percentage = _BATTERY_PERCENTAGE_LUT[battery]
+        position = int(position * _POS_SCALE)
+        if is_lock_range:
             lock_status = "locked"
-        elif raw_mech_status["is_unlock_range"]:
+        elif is_unlock_range:
             lock_status = "unlocked"
         else:
             lock_status = "unknown"
-        timestamp = int(time.time())
+        timestamp = time.time_ns() // 1_000_000_000
         mech_status_webapi_format = {
             "batteryPercentage": battery_percentage,
             "batteryVoltage": battery_voltage,
@@ -185,66 +326,3 @@ class ReceivedDataHandler:
             "timestamp": timestamp,
         }
         return mech_status_webapi_format
-
-    def _calculate_battery_percentage(self, voltage: float) -> int:
-        """Convert voltage reading to estimated battery percentage.
-
-        Args:
-            voltage (float): Battery voltage in volts.
-
-        Returns:
-            int: Battery percentage between 0 and 100.
-        """
-        voltage_levels = (
-            5.85,
-            5.82,
-            5.79,
-            5.76,
-            5.73,
-            5.70,
-            5.65,
-            5.60,
-            5.55,
-            5.50,
-            5.40,
-            5.20,
-            5.10,
-            5.0,
-            4.8,
-            4.6,
-        )
-        battery_percentages = (
-            100.0,
-            95.0,
-            90.0,
-            85.0,
-            80.0,
-            70.0,
-            60.0,
-            50.0,
-            40.0,
-            32.0,
-            21.0,
-            13.0,
-            10.0,
-            7.0,
-            3.0,
-            0.0,
-        )
-        if voltage >= voltage_levels[0]:
-            return int(battery_percentages[0])
-        if voltage <= voltage_levels[-1]:
-            return int(battery_percentages[-1])
-        for i in range(len(voltage_levels) - 1):
-            upper_voltage = voltage_levels[i]
-            lower_voltage = voltage_levels[i + 1]
-            if lower_voltage < voltage <= upper_voltage:
-                voltage_ratio = (voltage - lower_voltage) / (
-                    upper_voltage - lower_voltage
-                )
-                upper_percent = battery_percentages[i]
-                lower_percent = battery_percentages[i + 1]
-                return int(
-                    (upper_percent - lower_percent) * voltage_ratio + lower_percent
-                )
-        return 0
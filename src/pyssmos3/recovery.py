@@ -28,6 +28,20 @@ class RecoveryManager:
             permanently failed after exceeding maximum retries.
     """
 
+    __slots__ = (
+        "is_recovery_failed",
+        "_callback_on_failed",
+        "_recovery_event",
+        "_fail_count",
+        "_stop_thread",
+        "_thread",
+        "_monitoring",
+        "_recovery_function",
+        "_max_retries",
+        "_interval",
+        "_spawn_lock",
+    )
+
     def __init__(self, on_failed: Callable[[], None]) -> None:
         """
         Initializes the RecoveryManager.
@@ -42,16 +56,22 @@ class RecoveryManager:
         self._fail_count: int = 0
         self._stop_thread: bool = False
         self._thread: threading.Thread | None = None
+        self._monitoring: bool = False
+        self._recovery_function: Callable[[], None] | None = None
+        self._max_retries: int = 0
+        self._interval: int = 0
+        self._spawn_lock: threading.Lock = threading.Lock()
 
     def start_monitoring(
         self, recovery_function: Callable[[], None], max_retries: int, interval: int
     ) -> None:
-        """Starts a daemon thread to monitor and trigger recovery on failure events.
+        """Starts monitoring and triggering recovery on failure events.
 
-        Launches a background thread that waits for the internal recovery event to be set.
-        When triggered, it attempts to call the provided recovery function. If recovery
-        fails consecutively more than `max_try` times, the failure callback is invoked
-        and monitoring stops.
+        The monitoring thread is spawned lazily by the first failure trigger,
+        so a client that never fails does not keep a dedicated OS thread
+        alive. When triggered, the manager calls the provided recovery
+        function. If recovery fails consecutively more than `max_retries`
+        times, the failure callback is invoked and monitoring stops.
 
         Args:
             recovery_function (Callable[[], None]): The recovery function to invoke upon failure.
@@ -59,37 +79,61 @@ class RecoveryManager:
             interval (int): Number of seconds to wait between recovery attempts.
 
         Raises:
-            RuntimeError: If the recovery thread is already running.
+            RuntimeError: If recovery monitoring is already running.
         """
-
-        def monitoring_loop() -> None:
-            while not self._stop_thread:
-                self._recovery_event.wait()
-                self._recovery_event.clear()
-                if self._stop_thread:
-                    break
-                if self._fail_count >= max_retries:
-                    logger.error("Recovery failed more than %s times.", max_retries)
-                    self.is_recovery_failed = True
-                    self._callback_on_failed()
-                    break
-                self._fail_count += 1
-                logger.info(
-                    "Recovery after %s seconds. fail_count: %s",
-                    interval,
-                    self._fail_count,
-                )
-                time.sleep(interval)
-                recovery_function()
-
-        if self._thread and self._thread.is_alive():
+        if self._monitoring:
             raise RuntimeError("Recovery thread already running.")
         self.is_recovery_failed = False
         self._stop_thread = False
         self._fail_count = 0
-        self._thread = threading.Thread(target=monitoring_loop, daemon=True)
-        self._thread.start()
-        logger.debug("Recovery thread started.")
+        self._recovery_function = recovery_function
+        self._max_retries = max_retries
+        self._interval = interval
+        self._recovery_event.clear()
+        self._monitoring = True
+        logger.debug("Recovery monitoring started.")
+
+    def _monitoring_loop(
+        self, recovery_function: Callable[[], None], max_retries: int, interval: int
+    ) -> None:
+        """Waits for failure events and runs the recovery function.
+
+        Args:
+            recovery_function (Callable[[], None]): The recovery function to invoke upon failure.
+            max_retries (int): Maximum number of allowed recovery attempts before critical failure.
+            interval (int): Number of seconds to wait between recovery attempts.
+        """
+        while not self._stop_thread:
+            self._recovery_event.wait()
+            self._recovery_event.clear()
+            if self._stop_thread:
+                break
+            if self._fail_count >= max_retries:
+                logger.error("Recovery failed more than %s times.", max_retries)
+                self.is_recovery_failed = True
+                self._callback_on_failed()
+                break
+            self._fail_count += 1
+            logger.info(
+                "Recovery after %s seconds. fail_count: %s",
+                interval,
+                self._fail_count,
+            )
+            # Wait on the event instead of sleeping so stop_monitoring can
+            # interrupt the retry delay. Failure triggers arriving during the
+            # delay coalesce into the pending retry rather than shortening it.
+            deadline = time.monotonic() + interval
+            remaining = float(interval)
+            while remaining > 0:
+                if self._recovery_event.wait(timeout=remaining):
+                    if self._stop_thread:
+                        break
+                    self._recovery_event.clear()
+                remaining = deadline - time.monotonic()
+            if self._stop_thread:
+                break
+            recovery_function()
+        self._monitoring = False
 
     def stop_monitoring(self) -> None:
         """Stops the recovery monitoring thread.
@@ -99,28 +143,43 @@ class RecoveryManager:
         Raises:
             RuntimeError: If recovery thread is not running.
         """
-        if not (self._thread and self._thread.is_alive()):
+        if not self._monitoring:
             raise RuntimeError("Recovery thread is not running.")
         self._stop_thread = True
         self._recovery_event.set()
-        self._thread.join()
-        logger.debug("Recovery thread stopped.")
+        if self._thread and self._thread.is_alive():
+            self._thread.join()
+        self._monitoring = False
+        logger.debug("Recovery monitoring stopped.")
 
     def perform_recovery(self) -> None:
         """Triggers a recovery attempt.
 
-        This method sets the internal event flag to initiate recovery
-        in the background monitoring thread.
+        This method sets the internal event flag to initiate recovery in the
+        background monitoring thread, spawning the thread on first use.
         """
-        self._recovery_event.set()
+        # is_set is a lock-free read; skip the set() lock during failure bursts.
+        if not self._recovery_event.is_set():
+            self._recovery_event.set()
+        if not self._monitoring or self.is_recovery_failed:
+            return
+        with self._spawn_lock:
+            if not (self._thread and self._thread.is_alive()):
+                self._thread = threading.Thread(
+                    target=self._monitoring_loop,
+                    args=(self._recovery_function, self._max_retries, self._interval),
+                    daemon=True,
+                )
+                self._thread.start()
+                logger.debug("Recovery thread started.")
 
     def is_running(self) -> bool:
-        """Checks whether the recovery monitoring thread is currently active.
+        """Checks whether recovery monitoring is currently active.
 
         Returns:
-            bool: True if the thread is alive; False otherwise.
+            bool: True if monitoring is active; False otherwise.
         """
-        return bool(self._thread and self._thread.is_alive())
+        return self._monitoring
 
     def reset_fail_count(self) -> None:
         """Resets the internal counter for consecutive recovery failures.